@@ -1,10 +1,20 @@
 from __future__ import annotations as _annotations
 
+import re
+from bisect import bisect_left
+from collections.abc import Iterable
+
 from pydantic_ai.messages import TextPart, ThinkingPart
 
 START_THINK_TAG = '<think>'
 END_THINK_TAG = '</think>'
 
+# Matches either tag so the content can be scanned in a single pass, with no backtracking on unterminated tags.
+_THINK_TAG_RE = re.compile(f'{re.escape(START_THINK_TAG)}|{re.escape(END_THINK_TAG)}')
+
+# Joins contents for `split_many_into_text_and_thinking`, neither tag can match across it.
+_SEPARATOR = '\x00'
+
 
 def split_content_into_text_and_thinking(content: str) -> list[ThinkingPart | TextPart]:
     """Split a string into text and thinking parts.
@@ -15,22 +25,56 @@ def split_content_into_text_and_thinking(content: str) -> list[ThinkingPart | Te
     We use the `<think>` tag because that's how Groq uses it in the `raw` format, so instead of using `<Thinking>` or
     something else, we just match the tag to make it easier for other models that don't support the `ThinkingPart`.
     """
+    if START_THINK_TAG not in content:
+        # most content has no thinking at all, a substring search is cheaper than scanning for both tags
+        return [TextPart(content=content)] if content else []
+    return _split_tags(content, _THINK_TAG_RE.finditer(content), 0, len(content))
+
+
+def split_many_into_text_and_thinking(contents: list[str]) -> list[list[ThinkingPart | TextPart]]:
+    """Split each of a list of strings into text and thinking parts.
+
+    This gives the same result as calling `split_content_into_text_and_thinking` on each string, but scans all
+    of them for tags at once.
+    """
+    if any(_SEPARATOR in content for content in contents):
+        return [split_content_into_text_and_thinking(content) for content in contents]
+
+    joined = _SEPARATOR.join(contents)
+    matches = list(_THINK_TAG_RE.finditer(joined))
+    match_starts = [match.start() for match in matches]
+
+    results: list[list[ThinkingPart | TextPart]] = []
+    lo = start = 0
+    for content in contents:
+        end = start + len(content)
+        hi = bisect_left(match_starts, end, lo)
+        results.append(_split_tags(joined, matches[lo:hi], start, end))
+        lo, start = hi, end + len(_SEPARATOR)
+    return results
+
+
+def _split_tags(content: str, matches: Iterable[re.Match[str]], start: int, end: int) -> list[ThinkingPart | TextPart]:
+    """Split `content[start:end]` into text and thinking parts, given the tags found in that range."""
     parts: list[ThinkingPart | TextPart] = []
 
-    start_index = content.find(START_THINK_TAG)
-    while start_index >= 0:
-        before_think, content = content[:start_index], content[start_index + len(START_THINK_TAG) :]
-        if before_think:
-            parts.append(TextPart(content=before_think))
-        end_index = content.find(END_THINK_TAG)
-        if end_index >= 0:
-            think_content, content = content[:end_index], content[end_index + len(END_THINK_TAG) :]
-            parts.append(ThinkingPart(content=think_content))
-        else:
-            # We lose the `<think>` tag, but it shouldn't matter.
-            parts.append(TextPart(content=content))
-            content = ''
-        start_index = content.find(START_THINK_TAG)
-    if content:
-        parts.append(TextPart(content=content))
+    last = start
+    thinking = False
+    for match in matches:
+        tag = match.group()
+        if not thinking and tag == START_THINK_TAG:
+            if (tag_start := match.start()) > last:
+                parts.append(TextPart(content=content[last:tag_start]))
+            thinking = True
+            last = match.end()
+        elif thinking and tag == END_THINK_TAG:
+            parts.append(ThinkingPart(content=content[last : match.start()]))
+            thinking = False
+            last = match.end()
+
+    if thinking:
+        # We lose the `<think>` tag, but it shouldn't matter.
+        parts.append(TextPart(content=content[last:end]))
+    elif last < end:
+        parts.append(TextPart(content=content[last:end]))
     return parts
@@ -1,15 +1,19 @@
 from __future__ import annotations as _annotations
 
 from collections.abc import Iterable, Iterator, Mapping
-from dataclasses import asdict, dataclass, is_dataclass
-from datetime import date
-from typing import Any
+from dataclasses import asdict, dataclass, fields, is_dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, cast
 from xml.etree import ElementTree
 
 from pydantic import BaseModel
+from typing_extensions import TypeAlias
 
 __all__ = ('format_as_xml',)
 
+_Element = ElementTree.Element
+
 
 def format_as_xml(
     obj: Any,
@@ -51,63 +55,260 @@ def format_as_xml(
     '''
     ```
     """
-    el = _ToXml(item_tag=item_tag, none_str=none_str).to_xml(obj, root_tag)
-    if root_tag is None and el.text is None:
-        join = '' if indent is None else '\n'
-        return join.join(_rootless_xml_elements(el, indent))
+    tag = item_tag if root_tag is None else root_tag
+    # scalars don't need a tree at all, tags starting with `{` are treated as namespaced by ElementTree
+    if (text := _scalar_to_text(obj, none_str)) is not None and not tag.startswith('{'):
+        return _text_element(tag, text)
+
+    # at the top level, dataclasses and models produce the same XML as a dict of their fields, their class name
+    # is only used as a tag when they're nested
+    key = None
+    if not isinstance(obj, Mapping):
+        if is_dataclass(obj) and not isinstance(obj, type):
+            key = _cache_key({f.name: getattr(obj, f.name) for f in fields(obj)})
+            if key is None:
+                obj = asdict(obj)
+        elif isinstance(obj, BaseModel):
+            obj = obj.model_dump(mode='python')
+            key = _cache_key(obj)
+    if key is not None:
+        return _format_as_xml_cached(key, root_tag, item_tag, none_str, indent)
+    return _format_as_xml(obj, root_tag, item_tag, none_str, indent)
+
+
+def _format_as_xml(obj: Any, root_tag: str | None, item_tag: str, none_str: str, indent: str | None) -> str:
+    if isinstance(obj, dict):
+        xml = _flat_dict_to_xml(cast('dict[Any, Any]', obj), root_tag, none_str, indent)
+        if xml is not None:
+            return xml
+
+    rootless = root_tag is None
+    # without a root tag, the children of `el` are serialized as top level elements, so start one level up
+    el = _ToXml(item_tag=item_tag, none_str=none_str, indent=indent).to_xml(obj, root_tag, -1 if rootless else 0)
+    if rootless and (len(el) or el.text is None):
+        return _rootless_xml(el, indent)
     else:
-        if indent is not None:
-            ElementTree.indent(el, space=indent)
         return ElementTree.tostring(el, encoding='unicode')
 
 
+_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+
+def _scalar_to_text(value: Any, none_str: str) -> str | None:
+    """Get the text for a value of an exact builtin scalar type, or `None` if `value` is of any other type."""
+    t = type(value)  # pyright: ignore[reportUnknownVariableType]
+    if value is None:
+        return none_str
+    elif t is str:
+        return value
+    elif t is bytes or t is bytearray:
+        return value.decode(errors='ignore')
+    elif t is bool or t is int or t is float:
+        return str(value)
+    elif t is date or t is datetime:
+        return value.isoformat()
+    else:
+        return None
+
+
+def _text_element(tag: str, text: str) -> str:
+    """Write an element containing only text, the same way `ElementTree.tostring` does."""
+    return f'<{tag}>{text.translate(_ESCAPE)}</{tag}>' if text else f'<{tag} />'
+
+
+def _flat_dict_to_xml(obj: dict[Any, Any], root_tag: str | None, none_str: str, indent: str | None) -> str | None:
+    """Write XML for a dict with only scalar values directly, without going via `ElementTree`.
+
+    This produces the same output as `ElementTree.tostring`, returns `None` if `obj` contains anything else.
+    """
+    elements: list[str] = []
+    for key, value in obj.items():
+        if type(key) is int:
+            key = str(key)
+        elif type(key) is not str or key.startswith('{'):
+            # tags starting with `{` are treated as namespaced by ElementTree
+            return None
+        text = _scalar_to_text(value, none_str)
+        if text is None:
+            return None
+        elements.append(_text_element(key, text))
+
+    if root_tag is None:
+        return ('' if indent is None else '\n').join(elements)
+    elif root_tag.startswith('{'):
+        return None
+    elif not elements:
+        return f'<{root_tag} />'
+    elif indent is None:
+        return f'<{root_tag}>{"".join(elements)}</{root_tag}>'
+    else:
+        child_indent = '\n' + indent
+        return f'<{root_tag}>{child_indent}{child_indent.join(elements)}\n</{root_tag}>'
+
+
+# types where equal values of the same type always produce the same XML text, unlike e.g. `0.0 == -0.0`
+# or timezone-aware datetimes in different timezones
+_CACHEABLE_SCALAR_TYPES = frozenset({str, bytes, bool, int, type(None)})
+
+
+_CacheKey: TypeAlias = 'tuple[tuple[str, type, Any], ...]'
+
+
+def _cache_key(values: dict[str, Any]) -> _CacheKey | None:
+    """Build a key identifying the XML output for the fields of a dataclass or model, or `None` if they shouldn't be cached.
+
+    Keys include the types of values, so that e.g. `True` and `1` don't share a cache entry, and hold the values
+    themselves rather than the object, so the cache doesn't keep caller objects alive.
+    """
+    key: list[tuple[str, type, Any]] = []
+    for name, value in values.items():
+        if type(value) not in _CACHEABLE_SCALAR_TYPES:
+            return None
+        key.append((name, type(value), value))  # pyright: ignore[reportUnknownArgumentType]
+    return tuple(key)
+
+
+@lru_cache(maxsize=512)
+def _format_as_xml_cached(
+    key: _CacheKey, root_tag: str | None, item_tag: str, none_str: str, indent: str | None
+) -> str:
+    return _format_as_xml({name: value for name, _, value in key}, root_tag, item_tag, none_str, indent)
+
+
+_Handler: TypeAlias = 'Callable[[_ToXml, ElementTree.Element, Any, int], None]'
+
+
 @dataclass
 class _ToXml:
+    # `dataclass(slots=True)` requires Python 3.10
+    __slots__ = ('indent', 'item_tag', 'none_str')
+
     item_tag: str
     none_str: str
+    indent: str | None
 
-    def to_xml(self, value: Any, tag: str | None) -> ElementTree.Element:
-        element = ElementTree.Element(self.item_tag if tag is None else tag)
-        if value is None:
-            element.text = self.none_str
-        elif isinstance(value, str):
-            element.text = value
-        elif isinstance(value, (bytes, bytearray)):
-            element.text = value.decode(errors='ignore')
-        elif isinstance(value, (bool, int, float)):
-            element.text = str(value)
-        elif isinstance(value, date):
-            element.text = value.isoformat()
-        elif isinstance(value, Mapping):
-            self._mapping_to_xml(element, value)  # pyright: ignore[reportUnknownArgumentType]
-        elif is_dataclass(value) and not isinstance(value, type):
-            if tag is None:
-                element = ElementTree.Element(value.__class__.__name__)
-            dc_dict = asdict(value)
-            self._mapping_to_xml(element, dc_dict)
-        elif isinstance(value, BaseModel):
-            if tag is None:
-                element = ElementTree.Element(value.__class__.__name__)
-            self._mapping_to_xml(element, value.model_dump(mode='python'))
-        elif isinstance(value, Iterable):
-            for item in value:  # pyright: ignore[reportUnknownVariableType]
-                item_el = self.to_xml(item, None)
-                element.append(item_el)
-        else:
-            raise TypeError(f'Unsupported type for XML formatting: {type(value)}')
+    def to_xml(self, value: Any, tag: str | None, level: int) -> ElementTree.Element:
+        # fast path for exact builtin types, falling back to `isinstance` checks for subclasses and other types
+        handler: _Handler | None = self._DISPATCH.get(type(value))  # pyright: ignore[reportUnknownArgumentType]
+        if handler is None:
+            if isinstance(value, str):
+                handler = _ToXml._str_to_xml
+            elif isinstance(value, (bytes, bytearray)):
+                handler = _ToXml._bytes_to_xml
+            elif isinstance(value, (bool, int, float)):
+                handler = _ToXml._scalar_to_xml
+            elif isinstance(value, date):
+                handler = _ToXml._date_to_xml
+            elif isinstance(value, Mapping):
+                handler = _ToXml._mapping_to_xml
+            elif is_dataclass(value) and not isinstance(value, type):
+                if tag is None:
+                    tag = value.__class__.__name__
+                value = asdict(value)
+                handler = _ToXml._mapping_to_xml
+            elif isinstance(value, BaseModel):
+                if tag is None:
+                    tag = value.__class__.__name__
+                value = value.model_dump(mode='python')
+                handler = _ToXml._mapping_to_xml
+            elif isinstance(value, Iterable):
+                handler = _ToXml._iterable_to_xml
+            else:
+                raise TypeError(f'Unsupported type for XML formatting: {type(value)}')
+        element = _Element(self.item_tag if tag is None else tag)
+        handler(self, element, value, level)
         return element
 
-    def _mapping_to_xml(self, element: ElementTree.Element, mapping: Mapping[Any, Any]) -> None:
+    def _none_to_xml(self, element: ElementTree.Element, value: Any, level: int) -> None:
+        element.text = self.none_str
+
+    def _str_to_xml(self, element: ElementTree.Element, value: Any, level: int) -> None:
+        element.text = value
+
+    def _bytes_to_xml(self, element: ElementTree.Element, value: Any, level: int) -> None:
+        element.text = value.decode(errors='ignore')
+
+    def _scalar_to_xml(self, element: ElementTree.Element, value: Any, level: int) -> None:
+        element.text = str(value)
+
+    def _date_to_xml(self, element: ElementTree.Element, value: Any, level: int) -> None:
+        element.text = value.isoformat()
+
+    def _mapping_to_xml(self, element: ElementTree.Element, mapping: Any, level: int) -> None:
+        # bind these once, rather than looking them up for every child
+        append, to_xml = element.append, self.to_xml
         for key, value in mapping.items():
             if isinstance(key, int):
                 key = str(key)
             elif not isinstance(key, str):
                 raise TypeError(f'Unsupported key type for XML formatting: {type(key)}, only str and int are allowed')
-            element.append(self.to_xml(value, key))
+            append(to_xml(value, key, level + 1))
+        self._indent_children(element, level)
+
+    def _iterable_to_xml(self, element: ElementTree.Element, iterable: Any, level: int) -> None:
+        if isinstance(iterable, list) and iterable:
+            # lists of the same model (e.g. examples) are common, so work out how to format the items only once
+            items = cast('list[Any]', iterable)
+            cls = type(items[0])  # pyright: ignore[reportUnknownVariableType]
+            if issubclass(cls, BaseModel) and not issubclass(cls, Mapping) and all(type(item) is cls for item in items):
+                self._models_to_xml(element, items, cls.__name__, level)
+                return
+
+        append, to_xml = element.append, self.to_xml
+        for item in iterable:  # pyright: ignore[reportUnknownVariableType]
+            append(to_xml(item, None, level + 1))
+        self._indent_children(element, level)
+
+    def _models_to_xml(self, element: ElementTree.Element, models: list[BaseModel], tag: str, level: int) -> None:
+        append, mapping_to_xml = element.append, self._mapping_to_xml
+        for model in models:
+            model_element = _Element(tag)
+            mapping_to_xml(model_element, model.model_dump(mode='python'), level + 1)
+            append(model_element)
+        self._indent_children(element, level)
+
+    def _indent_children(self, element: ElementTree.Element, level: int) -> None:
+        """Add the same whitespace as `ElementTree.indent`, as we go, rather than with a second pass over the tree."""
+        if self.indent is None or not len(element):
+            return
+        element.text = child_indent = '\n' + self.indent * (level + 1)
+        for child in element:
+            child.tail = child_indent
+        element[-1].tail = '\n' + self.indent * level
+
+    _DISPATCH: ClassVar[dict[type[Any], _Handler]] = {
+        type(None): _none_to_xml,
+        str: _str_to_xml,
+        bytes: _bytes_to_xml,
+        bytearray: _bytes_to_xml,
+        bool: _scalar_to_xml,
+        int: _scalar_to_xml,
+        float: _scalar_to_xml,
+        date: _date_to_xml,
+        datetime: _date_to_xml,
+        dict: _mapping_to_xml,
+        list: _iterable_to_xml,
+        tuple: _iterable_to_xml,
+    }
+
+
+def _rootless_xml(root: ElementTree.Element, indent: str | None) -> str:
+    """Serialize the children of `root` as top level elements, omitting `root` itself."""
+    if not len(root):
+        return ''
+    # serialize all the children in one go, then cut off the root tags and the whitespace from `_indent_children`
+    xml = ElementTree.tostring(root, encoding='unicode')
+    start_tag, end_tag = f'<{root.tag}>', f'</{root.tag}>'
+    if xml.startswith(start_tag):
+        return xml[len(start_tag) : -len(end_tag)].strip('\n')
+    else:
+        # namespace declarations were added to the root tag, each element needs its own instead
+        join = '' if indent is None else '\n'
+        return join.join(_rootless_xml_elements(root))
 
 
-def _rootless_xml_elements(root: ElementTree.Element, indent: str | None) -> Iterator[str]:
+def _rootless_xml_elements(root: ElementTree.Element) -> Iterator[str]:
     for sub_element in root:
-        if indent is not None:
-            ElementTree.indent(sub_element, space=indent)
+        # `tostring` includes the tail, the joiner takes care of whitespace between top level elements
+        sub_element.tail = None
         yield ElementTree.tostring(sub_element, encoding='unicode')
@@ -7,7 +7,7 @@ from typing import Callable, Union
 from typing_extensions import Self
 
 from ..output import StructuredOutputMode
-from ._json_schema import JsonSchemaTransformer
+from ._json_schema import InlineDefsJsonSchemaTransformer, JsonSchemaTransformer
 
 
 @dataclass
@@ -58,3 +58,6 @@ class ModelProfile:
 ModelProfileSpec = Union[ModelProfile, Callable[[str], Union[ModelProfile, None]]]
 
 DEFAULT_PROFILE = ModelProfile()
+
+INLINE_DEFS_PROFILE = ModelProfile(json_schema_transformer=InlineDefsJsonSchemaTransformer)
+"""Profile shared by model families that only need `$defs` to be inlined in JSON schemas."""
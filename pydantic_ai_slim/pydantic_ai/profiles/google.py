@@ -1,5 +1,6 @@
 from __future__ import annotations as _annotations
 
+import json
 import warnings
 
 from pydantic_ai.exceptions import UserError
@@ -10,11 +11,22 @@ from ._json_schema import JsonSchema, JsonSchemaTransformer
 
 def google_model_profile(model_name: str) -> ModelProfile | None:
     """Get the model profile for a Google model."""
-    return ModelProfile(
-        json_schema_transformer=GoogleJsonSchemaTransformer,
-        supports_json_schema_output=True,
-        supports_json_object_output=True,
-    )
+    return _GOOGLE_PROFILE
+
+
+_UNSUPPORTED_KEYS = frozenset(
+    {
+        'title',
+        '$schema',
+        'discriminator',
+        'examples',
+        # TODO: Should we use the trick from pydantic_ai.models.openai._OpenAIJsonSchema
+        #   where we add notes about these properties to the field description?
+        'exclusiveMaximum',
+        'exclusiveMinimum',
+    }
+)
+"""Keys Gemini doesn't support, which are removed from the schema."""
 
 
 class GoogleJsonSchemaTransformer(JsonSchemaTransformer):
@@ -48,18 +60,12 @@ class GoogleJsonSchemaTransformer(JsonSchemaTransformer):
                 UserWarning,
             )
 
-        schema.pop('title', None)
-        schema.pop('$schema', None)
+        # most schemas contain few or none of these keys, so find the ones present rather than popping each of them
+        for key in _UNSUPPORTED_KEYS.intersection(schema):
+            del schema[key]
         if (const := schema.pop('const', None)) is not None:
             # Gemini doesn't support const, but it does support enum with a single value
             schema['enum'] = [const]
-        schema.pop('discriminator', None)
-        schema.pop('examples', None)
-
-        # TODO: Should we use the trick from pydantic_ai.models.openai._OpenAIJsonSchema
-        #   where we add notes about these properties to the field description?
-        schema.pop('exclusiveMaximum', None)
-        schema.pop('exclusiveMinimum', None)
 
         # Gemini only supports string enums, so we need to convert any enum values to strings.
         # Pydantic will take care of transforming the transformed string values to the correct type.
@@ -88,11 +94,8 @@ class GoogleJsonSchemaTransformer(JsonSchemaTransformer):
             # prefixItems is not currently supported in Gemini, so we convert it to items for best compatibility
             prefix_items = schema.pop('prefixItems')
             items = schema.get('items')
-            unique_items = [items] if items is not None else []
-            for item in prefix_items:
-                if item not in unique_items:
-                    unique_items.append(item)
-            if len(unique_items) > 1:  # pragma: no cover
+            unique_items = _unique_items(prefix_items if items is None else [items, *prefix_items])
+            if len(unique_items) > 1:
                 schema['items'] = {'anyOf': unique_items}
             elif len(unique_items) == 1:  # pragma: no branch
                 schema['items'] = unique_items[0]
@@ -101,3 +104,23 @@ class GoogleJsonSchemaTransformer(JsonSchemaTransformer):
                 schema.setdefault('maxItems', len(prefix_items))
 
         return schema
+
+
+_GOOGLE_PROFILE = ModelProfile(
+    json_schema_transformer=GoogleJsonSchemaTransformer,
+    supports_json_schema_output=True,
+    supports_json_object_output=True,
+)
+
+
+def _unique_items(items: list[JsonSchema]) -> list[JsonSchema]:
+    """De-duplicate `items`, preserving order, using their canonical JSON as a key."""
+    unique: dict[str, JsonSchema] = {}
+    # inlined `$defs` are the same object wherever they're referenced, no need to serialize those again
+    seen_ids: set[int] = set()
+    for item in items:
+        if id(item) in seen_ids:
+            continue
+        seen_ids.add(id(item))
+        unique.setdefault(json.dumps(item, sort_keys=True, default=repr), item)
+    return list(unique.values())
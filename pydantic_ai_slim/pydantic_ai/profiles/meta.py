@@ -1,9 +1,8 @@
 from __future__ import annotations as _annotations
 
-from . import ModelProfile
-from ._json_schema import InlineDefsJsonSchemaTransformer
+from . import INLINE_DEFS_PROFILE, ModelProfile
 
 
 def meta_model_profile(model_name: str) -> ModelProfile | None:
     """Get the model profile for a Meta model."""
-    return ModelProfile(json_schema_transformer=InlineDefsJsonSchemaTransformer)
+    return INLINE_DEFS_PROFILE
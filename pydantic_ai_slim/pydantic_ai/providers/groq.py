@@ -1,7 +1,8 @@
 from __future__ import annotations as _annotations
 
 import os
-from typing import overload
+import re
+from typing import Callable, overload
 
 from httpx import AsyncClient as AsyncHTTPClient
 
@@ -25,6 +26,23 @@ except ImportError as _import_error:  # pragma: no cover
     ) from _import_error
 
 
+def _prefix_to_profile() -> dict[str, Callable[[str], ModelProfile | None]]:
+    # built on each call, so the profile functions are looked up when a profile is requested
+    return {
+        'llama': meta_model_profile,
+        'meta-llama/': meta_model_profile,
+        'gemma': google_model_profile,
+        'qwen': qwen_model_profile,
+        'deepseek': deepseek_model_profile,
+        'mistral': mistral_model_profile,
+        'moonshotai/': moonshotai_model_profile,
+    }
+
+
+# match all prefixes in one scan, rather than calling `startswith` for each of them
+_PREFIX_RE = re.compile('|'.join(map(re.escape, _prefix_to_profile())))
+
+
 class GroqProvider(Provider[AsyncGroq]):
     """Provider for Groq API."""
 
@@ -41,22 +59,12 @@ class GroqProvider(Provider[AsyncGroq]):
         return self._client
 
     def model_profile(self, model_name: str) -> ModelProfile | None:
-        prefix_to_profile = {
-            'llama': meta_model_profile,
-            'meta-llama/': meta_model_profile,
-            'gemma': google_model_profile,
-            'qwen': qwen_model_profile,
-            'deepseek': deepseek_model_profile,
-            'mistral': mistral_model_profile,
-            'moonshotai/': moonshotai_model_profile,
-        }
-
-        for prefix, profile_func in prefix_to_profile.items():
-            model_name = model_name.lower()
-            if model_name.startswith(prefix):
-                if prefix.endswith('/'):
-                    model_name = model_name[len(prefix) :]
-                return profile_func(model_name)
+        model_name = model_name.lower()
+        if match := _PREFIX_RE.match(model_name):
+            prefix = match.group()
+            if prefix.endswith('/'):
+                model_name = model_name[len(prefix) :]
+            return _prefix_to_profile()[prefix](model_name)
 
         return None
 
@@ -95,8 +103,6 @@ class GroqProvider(Provider[AsyncGroq]):
                     'Set the `GROQ_API_KEY` environment variable or pass it via `GroqProvider(api_key=...)`'
                     'to use the Groq provider.'
                 )
-            elif http_client is not None:
-                self._client = AsyncGroq(base_url=self.base_url, api_key=api_key, http_client=http_client)
-            else:
-                http_client = cached_async_http_client(provider='groq')
-                self._client = AsyncGroq(base_url=self.base_url, api_key=api_key, http_client=http_client)
+
+            http_client = http_client or cached_async_http_client(provider='groq')
+            self._client = AsyncGroq(base_url=self.base_url, api_key=api_key, http_client=http_client)
@@ -535,6 +535,63 @@ async def test_json_def_date(allow_model_requests: None):
     )
 
 
+async def test_json_def_prefix_items(allow_model_requests: None):
+    class Location(BaseModel):
+        lat: float
+        lng: float
+
+    class Route(BaseModel):
+        stops: tuple[Location, Location, float]
+
+    json_schema = Route.model_json_schema()
+
+    m = GeminiModel('gemini-1.5-flash', provider=GoogleGLAProvider(api_key='via-arg'))
+    output_tool = ToolDefinition(
+        name='result',
+        description='This is the tool for the final Result',
+        parameters_json_schema=json_schema,
+    )
+    mrp = ModelRequestParameters(
+        function_tools=[],
+        allow_text_output=True,
+        output_tools=[output_tool],
+        output_mode='text',
+        output_object=None,
+    )
+    mrp = m.customize_request_parameters(mrp)
+    assert m._get_tools(mrp) == snapshot(
+        _GeminiTools(
+            function_declarations=[
+                _GeminiFunction(
+                    name='result',
+                    description='This is the tool for the final Result',
+                    parameters={
+                        'properties': {
+                            'stops': {
+                                'maxItems': 3,
+                                'minItems': 3,
+                                'type': 'array',
+                                'items': {
+                                    'anyOf': [
+                                        {
+                                            'properties': {'lat': {'type': 'number'}, 'lng': {'type': 'number'}},
+                                            'required': ['lat', 'lng'],
+                                            'type': 'object',
+                                        },
+                                        {'type': 'number'},
+                                    ]
+                                },
+                            }
+                        },
+                        'required': ['stops'],
+                        'type': 'object',
+                    },
+                )
+            ]
+        )
+    )
+
+
 @dataclass
 class AsyncByteStreamList(httpx.AsyncByteStream):
     data: list[bytes]
@@ -1,5 +1,8 @@
+from __future__ import annotations as _annotations
+
 from dataclasses import dataclass
 from datetime import date, datetime
+from decimal import Decimal
 from typing import Any
 
 import pytest
@@ -171,6 +174,7 @@ def test_root_tag(input_obj: Any, output: str):
 """),
             id='list[date]',
         ),
+        pytest.param([], snapshot(''), id='empty list'),
     ],
 )
 def test_no_root(input_obj: Any, output: str):
@@ -200,3 +204,121 @@ def test_set():
 
 def test_custom_null():
     assert format_as_xml(None, none_str='nil') == snapshot('<item>nil</item>')
+    assert format_as_xml([None, {'a': [None]}], none_str='nil') == snapshot("""\
+<item>nil</item>
+<item>
+  <a>
+    <item>nil</item>
+  </a>
+</item>\
+""")
+
+
+def test_cached_output_tracks_values():
+    @dataclass
+    class Flag:
+        value: Any
+
+    assert format_as_xml(Flag(value=1)) == snapshot('<value>1</value>')
+    assert format_as_xml(Flag(value=True)) == snapshot('<value>True</value>')
+    assert format_as_xml(Flag(value=-0.0)) == snapshot('<value>-0.0</value>')
+    assert format_as_xml(Flag(value=0.0)) == snapshot('<value>0.0</value>')
+
+    model = ExamplePydanticModel(name='John', age=42)
+    assert format_as_xml(model, root_tag='user') == snapshot("""\
+<user>
+  <name>John</name>
+  <age>42</age>
+</user>\
+""")
+    model.age = 43
+    assert format_as_xml(model, root_tag='user', indent=None) == snapshot('<user><name>John</name><age>43</age></user>')
+
+    class OptionalFloat(BaseModel):
+        x: float | None
+
+    assert format_as_xml(OptionalFloat(x=float('inf'))) == snapshot('<x>inf</x>')
+    assert format_as_xml(OptionalFloat(x=float('nan'))) == snapshot('<x>nan</x>')
+    assert format_as_xml(OptionalFloat(x=None)) == snapshot('<x>null</x>')
+
+    class Price(BaseModel):
+        amount: Decimal
+
+    for _ in range(2):
+        with pytest.raises(TypeError, match="Unsupported type for XML formatting: <class 'decimal.Decimal'>"):
+            format_as_xml(Price(amount=Decimal('1.5')))
+
+
+def test_subclasses():
+    class MyStr(str):
+        pass
+
+    class MyBytes(bytes):
+        pass
+
+    class MyInt(int):
+        pass
+
+    class MyDate(date):
+        pass
+
+    class MyDict(dict[str, Any]):
+        pass
+
+    obj = MyDict(s=MyStr('x'), b=MyBytes(b'y'), i=MyInt(3), d=MyDate(2025, 1, 2))
+    assert format_as_xml(obj, indent=None) == snapshot('<s>x</s><b>y</b><i>3</i><d>2025-01-02</d>')
+
+
+def test_flat_dict():
+    obj = {'a': '', 'b': 'x & <y>', 1: None, 'c': b'', 'd': 1.5, 'e': datetime(2025, 1, 1, 12, 13)}
+    assert format_as_xml(obj, root_tag='r') == snapshot("""\
+<r>
+  <a />
+  <b>x &amp; &lt;y&gt;</b>
+  <1>null</1>
+  <c />
+  <d>1.5</d>
+  <e>2025-01-01T12:13:00</e>
+</r>\
+""")
+    assert format_as_xml(obj, indent=None, none_str='') == snapshot(
+        '<a /><b>x &amp; &lt;y&gt;</b><1 /><c /><d>1.5</d><e>2025-01-01T12:13:00</e>'
+    )
+    assert format_as_xml({}, root_tag='r') == snapshot('<r />')
+    assert format_as_xml({}) == snapshot('')
+    assert format_as_xml({'{ns}a': 1}, root_tag='r', indent=None) == snapshot('<r xmlns:ns0="ns"><ns0:a>1</ns0:a></r>')
+    assert format_as_xml({'a': 1}, root_tag='{ns}r', indent=None) == snapshot('<ns0:r xmlns:ns0="ns"><a>1</a></ns0:r>')
+
+    obj = {'dc': ExampleDataclass(name='John', age=42), 'model': ExamplePydanticModel(name='Jane', age=41)}
+    assert format_as_xml(obj, indent=None) == snapshot(
+        '<dc><name>John</name><age>42</age></dc><model><name>Jane</name><age>41</age></model>'
+    )
+
+
+def test_list_of_models():
+    class OtherPydanticModel(BaseModel):
+        name: str
+
+    models = [ExamplePydanticModel(name='John', age=42), ExamplePydanticModel(name='Jane', age=43)]
+    assert format_as_xml(models, indent=None) == snapshot(
+        '<ExamplePydanticModel><name>John</name><age>42</age></ExamplePydanticModel>'
+        '<ExamplePydanticModel><name>Jane</name><age>43</age></ExamplePydanticModel>'
+    )
+    assert format_as_xml([*models, OtherPydanticModel(name='Jim')], indent=None) == snapshot(
+        '<ExamplePydanticModel><name>John</name><age>42</age></ExamplePydanticModel>'
+        '<ExamplePydanticModel><name>Jane</name><age>43</age></ExamplePydanticModel>'
+        '<OtherPydanticModel><name>Jim</name></OtherPydanticModel>'
+    )
+
+
+def test_no_root_namespaced():
+    assert format_as_xml([{'{ns}a': [1]}, 2]) == snapshot("""\
+<item xmlns:ns0="ns">
+  <ns0:a>
+    <item>1</item>
+  </ns0:a>
+</item>
+<item>2</item>\
+""")
+    assert format_as_xml(1, root_tag='{ns}a') == snapshot('<ns0:a xmlns:ns0="ns">1</ns0:a>')
+    assert format_as_xml('') == snapshot('<item />')
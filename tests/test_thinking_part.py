@@ -3,13 +3,14 @@ from __future__ import annotations as _annotations
 import pytest
 from inline_snapshot import snapshot
 
-from pydantic_ai._thinking_part import split_content_into_text_and_thinking
+from pydantic_ai._thinking_part import split_content_into_text_and_thinking, split_many_into_text_and_thinking
 from pydantic_ai.messages import ModelResponsePart, TextPart, ThinkingPart, ThinkingPartDelta
 
 
 @pytest.mark.parametrize(
     ('content', 'parts'),
     [
+        ('', []),
         ('foo bar', [TextPart(content='foo bar')]),
         (
             'foo bar<think>thinking</think>',
@@ -23,12 +24,36 @@ from pydantic_ai.messages import ModelResponsePart, TextPart, ThinkingPart, Thin
             'foo bar<think>thinking',
             [TextPart(content='foo bar'), TextPart(content='thinking')],
         ),
+        (
+            '<think>one</think>foo\n<think>two\nlines</think>',
+            [ThinkingPart(content='one'), TextPart(content='foo\n'), ThinkingPart(content='two\nlines')],
+        ),
+        (
+            'foo</think>bar<think>a<think>b</think>',
+            [TextPart(content='foo</think>bar'), ThinkingPart(content='a<think>b')],
+        ),
     ],
 )
 def test_split_content_into_text_and_thinking(content: str, parts: list[ModelResponsePart]):
     assert split_content_into_text_and_thinking(content) == parts
 
 
+def test_split_many_into_text_and_thinking():
+    contents = ['foo<think>thinking', '</think>bar', '', '<think>a</think>b', 'nul\x00<think>c</think>']
+    assert split_many_into_text_and_thinking(contents) == snapshot(
+        [
+            [TextPart(content='foo'), TextPart(content='thinking')],
+            [TextPart(content='</think>bar')],
+            [],
+            [ThinkingPart(content='a'), TextPart(content='b')],
+            [TextPart(content='nul\x00'), ThinkingPart(content='c')],
+        ]
+    )
+    assert split_many_into_text_and_thinking(contents[:-1]) == [
+        split_content_into_text_and_thinking(content) for content in contents[:-1]
+    ]
+
+
 def test_thinking_part_delta_applies_both_content_and_signature():
     thinking_part = ThinkingPart(content='Initial content', signature='initial_sig')
     delta = ThinkingPartDelta(content_delta=' added', signature_delta='new_sig')